@@ -1,5 +1,5 @@
-from .codenamize import codenamize, codenamize_particles, codenamize_space
+from .codenamize import build_codename_table, codenamize, codenamize_from_index, codenamize_many, codenamize_particles, codenamize_particles_bulk, codenamize_space, set_codename_table_max_size
 
 __author__ = 'Jose Juan Montes [@jjmontesl]'
 __description__ = 'Generate consistent easier-to-remember codenames from strings and numbers.'
-__version__ = '1.2.3'
+__version__ = '1.3.0'
@@ -1,7 +1,6 @@
 # codenamize module
 # Generate consistent easier-to-remember codenames from strings and numbers.
 # Jose Juan Montes 2015-2016 - MIT License
-import six
 
 """
 Returns consistent codenames for objects, by joining
@@ -24,31 +23,31 @@ Import the codenamize function:
 Consecutive numbers yield differentiable codenames:
 
     >>> codenamize("1")
-    'familiar-grand'
+    'canopied-weed'
     >>> codenamize("2")
-    'little-tip'
+    'listening-cane'
 
 If you later want to add more adjectives, your existing codenames
 are retained as suffixes:
 
     >>> codenamize("11:22:33:44:55:66")
-    'craven-delivery'
+    'watching-tam'
     >>> codenamize("11:22:33:44:55:66", 2)
-    'separate-craven-delivery'
+    'brambly-watching-tam'
 
 Integers are internally converted to strings:
 
     >>> codenamize(1)
-    'familiar-grand'
+    'canopied-weed'
 
 Other options (max characters, join character, capitalize):
 
     >>> codenamize(0x123456aa, 2, 3, '', True)
-    'SadBigFat'
+    'LowSetRye'
     >>> codenamize(0x123456aa, 2, 0, '', True)
-    'BrawnyEminentBear'
+    'LengtheningGraveledLight'
     >>> codenamize(0x123456aa, 4, 0, ' ', False)
-    'disagreeable modern brawny eminent bear'
+    'looser deep lengthening graveled light'
 
 
 Examples
@@ -57,15 +56,15 @@ Examples
 For numbers 100000-100009 show codenames with 0-2 adjectives and different options:
 
     OBJ       ADJ0-MAX5    ADJ1-MAX5         ADJ2-MAX5  ADJ-0, ADJ-1, ADJ-2 (capitalized, empty join character)
-    100001         boat   funny-boat   real-funny-boat  Community, RacialCommunity, PluckyRacialCommunity
-    100002        award  first-award  tidy-first-award  Repeat, UptightRepeat, HelpfulUptightRepeat
-    100003         rush   super-rush  equal-super-rush  Intention, ExpensiveIntention, JazzyExpensiveIntention
-    100004        uncle   calm-uncle   icky-calm-uncle  March, SubduedMarch, AdamantSubduedMarch
-    100005        salad   warm-salad   true-warm-salad  Plant, QuickestPlant, ReminiscentQuickestPlant
-    100006         gift   witty-gift    odd-witty-gift  Estimate, CreepyEstimate, SpectacularCreepyEstimate
-    100007          son     zany-son    gaudy-zany-son  Truck, MiniatureTruck, OptimalMiniatureTruck
-    100008        angle   damp-angle  dusty-damp-angle  Steak, SpectacularSteak, RightfulSpectacularSteak
-    100009         link   utter-link   null-utter-link  Bike, ImportantBike, SweetImportantBike
+    100001        perch  faint-perch dusty-faint-perch  Moon, EtchedMoon, GroundingEtchedMoon
+    100002         bank    late-bank   plain-late-bank  Ridge, EarliestRidge, ModestEarliestRidge
+    100003          bud      set-bud     vivid-set-bud  Reptile, InfiniteReptile, GrittyInfiniteReptile
+    100004          rye    smoky-rye   loose-smoky-rye  Driftwood, PlungingDriftwood, AlignedPlungingDriftwood
+    100005        plane  mossy-plane  deep-mossy-plane  Wheat, WaveringWheat, ShadingWaveringWheat
+    100006        peach  faint-peach  cool-faint-peach  Squid, FurrowedSquid, MistyFurrowedSquid
+    100007        shape  borne-shape quiet-borne-shape  Cloud, AwareCloud, GentlestAwareCloud
+    100008        flare    icy-flare   muddy-icy-flare  Fan, PooledFan, MeltedPooledFan
+    100009        stork   easy-stork   pure-easy-stork  Amber, DelicateAmber, TricklingDelicateAmber
 
 Codename space sizes
 --------------------
@@ -75,31 +74,32 @@ many codenames you need to fit the number of objects you'll handle, since
 the probability of collision increases with the number of different objects
 used.
 
-    0 adj (max 3 chars) = 115 combinations
-    0 adj (max 4 chars) = 438 combinations
-    0 adj (max 5 chars) = 742 combinations
-    0 adj (max 6 chars) = 987 combinations
-    0 adj (max 7 chars) = 1176 combinations
-    0 adj (max 0 chars) = 1525 combinations
-    1 adj (max 3 chars) = 2760 combinations
-    1 adj (max 4 chars) = 56940 combinations
-    1 adj (max 5 chars) = 241150 combinations
-    1 adj (max 6 chars) = 492513 combinations
-    1 adj (max 7 chars) = 789096 combinations
-    1 adj (max 0 chars) = 1701900 combinations
-    2 adj (max 3 chars) = 66240 combinations
-    2 adj (max 4 chars) = 7402200 combinations
-    2 adj (max 5 chars) = 78373750 combinations
-    2 adj (max 6 chars) = 245763987 combinations
-    2 adj (max 7 chars) = 529483416 combinations
-    2 adj (max 0 chars) = 1899320400 combinations
+    0 adj (max 3 chars) = 42 combinations
+    0 adj (max 4 chars) = 188 combinations
+    0 adj (max 5 chars) = 321 combinations
+    0 adj (max 6 chars) = 395 combinations
+    0 adj (max 7 chars) = 437 combinations
+    0 adj (max 0 chars) = 467 combinations
+    1 adj (max 3 chars) = 168 combinations
+    1 adj (max 4 chars) = 4512 combinations
+    1 adj (max 5 chars) = 20865 combinations
+    1 adj (max 6 chars) = 61225 combinations
+    1 adj (max 7 chars) = 126293 combinations
+    1 adj (max 0 chars) = 225561 combinations
+    2 adj (max 3 chars) = 672 combinations
+    2 adj (max 4 chars) = 108288 combinations
+    2 adj (max 5 chars) = 1356225 combinations
+    2 adj (max 6 chars) = 9489875 combinations
+    2 adj (max 7 chars) = 36498677 combinations
+    2 adj (max 0 chars) = 108945963 combinations
 
 An example is shown by running  codenamize --tests .
 """
 
-import argparse
 import hashlib
 import functools
+import itertools
+import os
 import sys
 
 
@@ -251,69 +251,325 @@ NOUNS.extend([
 ])
 
 
-# Sort by length and cache list ranges
-ADJECTIVES.sort(key=lambda x: len(x))
-NOUNS.sort(key=lambda x: len(x))
-ADJECTIVES_LENGTHS = { l: sum(1 for a in ADJECTIVES if len(a) <= l) for l in (3, 4, 5, 6, 7, 8, 9) }
-NOUNS_LENGTHS = { l: sum(1 for a in NOUNS if len(a) <= l) for l in (3, 4, 5, 6, 7, 8, 9) }
+# Hash objects ready to be copied for each algorithm, so that per-call
+# hashing avoids the hashlib name lookup and constructor
+_HASHER_TEMPLATES = {}
 
+# Additional hash algorithms not provided by name through hashlib.new()
+HASH_ALGORITHMS_EXTRA = {
+    'blake2b-16': lambda: hashlib.blake2b(digest_size=16),
+}
 
-def codenamize_particles(obj = None, adjectives = 1, max_item_chars = 0, hash_algo = 'md5'):
+
+# Hash algorithm that mixes integer objects with splitmix64 instead of hashing
+# their string representation (other objects are hashed with md5)
+HASH_ALGORITHM_FASTINT = 'fastint'
+
+MASK64 = 0xffffffffffffffff
+
+SPLITMIX64_GAMMA = 0x9e3779b97f4a7c15
+
+
+def _splitmix64(x):
+    """
+    Returns the splitmix64 output for the given 64 bit integer (gamma increment
+    followed by the finalizer, so that 0 is not a fixed point).
+    """
+    x = (x + SPLITMIX64_GAMMA) & MASK64
+    x = ((x ^ (x >> 30)) * 0xbf58476d1ce4e5b9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94d049bb133111eb) & MASK64
+    return x ^ (x >> 31)
+
+
+def _hash_int_fast(obj):
+    """
+    Returns a 64 bit hash of an integer of any size, mixing its 64 bit chunks.
+    """
+    # Zigzag encode so negative numbers do not collide with positive ones
+    x = obj << 1 if obj >= 0 else ((-obj) << 1) - 1
+    h = 0
+    while True:
+        h = _splitmix64(h ^ (x & MASK64))
+        x >>= 64
+        if not x:
+            return h
+
+
+def _get_hasher(hash_algo):
+    """
+    Returns a new hash object for the given algorithm name, copied from a
+    cached template.
     """
-    Returns an array a list of consistent codenames for the given object, by joining random
+    hh = _HASHER_TEMPLATES.get(hash_algo)
+    if hh is None:
+        if hash_algo in HASH_ALGORITHMS_EXTRA:
+            hh = HASH_ALGORITHMS_EXTRA[hash_algo]()
+        else:
+            hh = hashlib.new(hash_algo)
+        _HASHER_TEMPLATES[hash_algo] = hh
+    return hh.copy()
+
+
+def _length_prefixes(words):
+    """
+    Returns a dict mapping each max_item_chars value (3 to 9) to the number of
+    words of at most that length, counting word lengths in a single pass.
+    """
+    counts = [0] * 11
+    for w in words:
+        counts[min(len(w), 10)] += 1
+    prefix = 0
+    lengths = {}
+    for l in range(0, 10):
+        prefix += counts[l]
+        if l >= 3:
+            lengths[l] = prefix
+    return lengths
+
+
+# Remove duplicated words (keeping first occurrence order) so that every
+# codename in the space is distinct
+ADJECTIVES = list(dict.fromkeys(ADJECTIVES))
+NOUNS = list(dict.fromkeys(NOUNS))
+
+# Sort by length, intern words, freeze and cache list ranges
+ADJECTIVES.sort(key=len)
+NOUNS.sort(key=len)
+ADJECTIVES = tuple(sys.intern(w) for w in ADJECTIVES)
+NOUNS = tuple(sys.intern(w) for w in NOUNS)
+ADJECTIVES_LENGTHS = _length_prefixes(ADJECTIVES)
+NOUNS_LENGTHS = _length_prefixes(NOUNS)
+ADJECTIVES_LENGTHS[0] = len(ADJECTIVES)
+NOUNS_LENGTHS[0] = len(NOUNS)
+
+# Optionally truncate word lists to power of two sizes, so that codename space
+# indexes are obtained with a bit mask instead of a modulo. This changes
+# codenames, and is enabled with the CODENAMIZE_POW2_SPACES environment variable.
+POW2_SPACES = os.environ.get('CODENAMIZE_POW2_SPACES', '') not in ('', '0')
+if POW2_SPACES:
+    ADJECTIVES_LENGTHS = { l: 1 << (n.bit_length() - 1) for l, n in ADJECTIVES_LENGTHS.items() }
+    NOUNS_LENGTHS = { l: 1 << (n.bit_length() - 1) for l, n in NOUNS_LENGTHS.items() }
+
+# Precompute word lists for each max_item_chars value (0 for no limit)
+ADJECTIVES_BY_MAX = { l: ADJECTIVES[:ADJECTIVES_LENGTHS[l]] for l in ADJECTIVES_LENGTHS }
+NOUNS_BY_MAX = { l: NOUNS[:NOUNS_LENGTHS[l]] for l in NOUNS_LENGTHS }
+
+# Capitalized variants of the word lists (used when capitalize is requested)
+ADJECTIVES_CAP = tuple(sys.intern(w[:1].upper() + w[1:]) for w in ADJECTIVES)
+NOUNS_CAP = tuple(sys.intern(w[:1].upper() + w[1:]) for w in NOUNS)
+ADJECTIVES_BY_MAX_CAP = { l: ADJECTIVES_CAP[:ADJECTIVES_LENGTHS[l]] for l in ADJECTIVES_LENGTHS }
+NOUNS_BY_MAX_CAP = { l: NOUNS_CAP[:NOUNS_LENGTHS[l]] for l in NOUNS_LENGTHS }
+
+
+# NumPy module and word arrays used by the vectorized bulk path, loaded on
+# first use so that importing this module does not import NumPy
+_BULK_ARRAYS = None
+
+
+def _get_bulk_arrays():
+    """
+    Returns a tuple (numpy, arrays), where arrays maps capitalize (boolean) to
+    (nouns, adjectives) object arrays, or None if NumPy is not available.
+
+    Lists for each max_item_chars are prefixes of the sorted lists, so a single
+    array per list serves every max_item_chars value.
+    """
+    global _BULK_ARRAYS
+    if _BULK_ARRAYS is None:
+        try:
+            import numpy
+        except ImportError:
+            _BULK_ARRAYS = False
+        else:
+            _BULK_ARRAYS = (numpy, {
+                False: (numpy.array(NOUNS, dtype=object), numpy.array(ADJECTIVES, dtype=object)),
+                True: (numpy.array(NOUNS_CAP, dtype=object), numpy.array(ADJECTIVES_CAP, dtype=object)),
+            })
+    return _BULK_ARRAYS or None
+
+
+def _clamp_max_item_chars(max_item_chars):
+    """
+    Returns the effective max_item_chars value (3 to 9, or 0 for no limit).
+    """
+    # Minimum length of 3 is required
+    if max_item_chars > 0 and max_item_chars < 3:
+        max_item_chars = 3
+    if max_item_chars > 9 or max_item_chars < 0:
+        max_item_chars = 0
+    return max_item_chars
+
+
+def _hash_object(obj, hash_algo):
+    """
+    Returns the integer hash used to select the codename for the given object.
+    """
+    if hash_algo == HASH_ALGORITHM_FASTINT:
+        # Only exact ints (not bools or other int subclasses), as with md5
+        # True and 1 have different codenames
+        if type(obj) is int:
+            return _hash_int_fast(obj)
+        hash_algo = 'md5'
+
+    # Convert numbers and strings to bytes (bytes are hashed as they are)
+    if isinstance(obj, int):
+        obj = str(obj).encode('utf-8')
+    elif isinstance(obj, str):
+        obj = obj.encode('utf-8')
+
+    hh = _get_hasher(hash_algo)
+    hh.update(obj)
+    return int.from_bytes(hh.digest(), 'big')
+
+
+def _decompose(index, adjectives, nouns, adjs):
+    """
+    Returns the tuple of codename particles for an index into the codename space.
+    """
+    # Fill particles from the end (noun last) so no reversal is needed
+    codename_particles = [ None ] * (adjectives + 1)
+    index, r = divmod(index, len(nouns))
+    codename_particles[-1] = nouns[r]
+    n_adj = len(adjs)
+    for i in range(adjectives - 1, -1, -1):
+        index, r = divmod(index, n_adj)
+        codename_particles[i] = adjs[r]
+
+    return tuple(codename_particles)
+
+
+def _memoize(maxsize):
+    """
+    Returns a decorator that memoizes a function with lru_cache. Calls with
+    unhashable arguments (e.g. bytearray objects) are not cached. The cache
+    can be cleared with the function cache_clear().
+    """
+    def decorator(func):
+        cached = functools.lru_cache(maxsize=maxsize, typed=True)(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # Check hashability up front, so that errors raised by func
+            # itself propagate instead of triggering an uncached retry
+            try:
+                hash((args, tuple(kwargs.items())))
+            except TypeError:
+                return func(*args, **kwargs)
+            return cached(*args, **kwargs)
+
+        wrapper.cache_clear = cached.cache_clear
+        wrapper.cache_info = cached.cache_info
+        return wrapper
+
+    return decorator
+
+
+@_memoize(maxsize=4096)
+def codenamize_particles(obj = None, adjectives = 1, max_item_chars = 0, hash_algo = 'md5', capitalize = False):
+    """
+    Returns a tuple of consistent codename particles for the given object, by joining random
     adjectives and words together.
 
     Args:
         obj (int|string): The object to assign a codename.
         adjectives (int): Number of adjectives to use (default 1).
         max_item_chars (int): Max characters of each part of the codename (0 for no limit).
+        hash_algo (string): Hash algorithm name, as accepted by hashlib.new(),
+            'blake2b-16' for a faster 128 bit BLAKE2b digest, or 'fastint' to mix
+            integers with splitmix64 instead of hashing them (other objects,
+            including bools and int subclasses, use md5; only suitable for
+            spaces below 2**64) (default 'md5').
+        capitalize (boolean): Capitalize first letter of each word (default False).
 
     Changing max_item_length will produce different results for the same objects,
     so existing mapped codenames will change substantially.
 
     Using None as object will make this function return the size of the
     codename space for the given options as an integer.
+
+    Results are memoized, so repeated lookups of the same object and options
+    are served from cache (unhashable objects, such as bytearray, are not
+    cached). The cache can be cleared with codenamize_particles.cache_clear().
     """
 
-    # Minimum length of 3 is required
-    if max_item_chars > 0 and max_item_chars < 3:
-        max_item_chars = 3
-    if max_item_chars > 9:
-        max_item_chars = 0
+    max_item_chars = _clamp_max_item_chars(max_item_chars)
+    adjectives = max(adjectives, 0)
 
     # Prepare codename word lists and calculate size of codename space
-    particles = [ NOUNS ] + [ ADJECTIVES for _ in range(0, adjectives) ]
-    if max_item_chars > 0:
-        particles[0] = NOUNS[:NOUNS_LENGTHS[max_item_chars]]
-        particles[1:] = [ ADJECTIVES[:ADJECTIVES_LENGTHS[max_item_chars]] for _ in range(0, adjectives) ]
+    nouns = NOUNS_BY_MAX[max_item_chars]
+    adjs = ADJECTIVES_BY_MAX[max_item_chars]
 
-    total_words = functools.reduce(lambda a, b: a * b, [len(p) for p in particles], 1)
+    n_noun = NOUNS_LENGTHS[max_item_chars]
+    n_adj = ADJECTIVES_LENGTHS[max_item_chars]
+    total_words = n_noun * n_adj ** adjectives if adjectives > 0 else n_noun
 
     # Return size of codename space if no object is passed
     if obj is None:
         return total_words
 
-    # Convert numbers to strings
-    if isinstance(obj, six.integer_types):
-        obj = str(obj)
+    if capitalize:
+        nouns = NOUNS_BY_MAX_CAP[max_item_chars]
+        adjs = ADJECTIVES_BY_MAX_CAP[max_item_chars]
 
-    if isinstance(obj, six.text_type):
-        obj = obj.encode('utf-8')
+    # Calculate codename words
+    if POW2_SPACES:
+        index = _hash_object(obj, hash_algo) & (total_words - 1)
+    else:
+        index = _hash_object(obj, hash_algo) % total_words
+    return _decompose(index, adjectives, nouns, adjs)
 
-    hh = hashlib.new(hash_algo)
-    hh.update(obj)
-    obj_hash = int(hh.hexdigest(), 16) * 36413321723440003717  # TODO: With next breaking change, remove the prime factor (and test)
 
-    # Calculate codename words
-    index = obj_hash % total_words
-    codename_particles = []
-    for p in particles:
-        codename_particles.append(p[(index) % len(p)])
-        index = int(index / len(p))
+def codenamize_particles_bulk(objs, adjectives = 1, max_item_chars = 0, hash_algo = 'md5', capitalize = False):
+    """
+    Returns a list with the tuple of codename particles for each of the given
+    objects. Results are the same as calling codenamize_particles() for each
+    object, but the index decomposition is vectorized with NumPy if available.
 
-    codename_particles.reverse()
+    Args:
+        objs (iterable): The objects (int|string) to assign codenames.
+        adjectives (int): Number of adjectives to use (default 1).
+        max_item_chars (int): Max characters of each part of the codename (0 for no limit).
+        hash_algo (string): Hash algorithm name (default 'md5').
+        capitalize (boolean): Capitalize first letter of each word (default False).
+    """
 
-    return codename_particles
+    max_item_chars = _clamp_max_item_chars(max_item_chars)
+    adjectives = max(adjectives, 0)
+    if capitalize:
+        nouns = NOUNS_BY_MAX_CAP[max_item_chars]
+        adjs = ADJECTIVES_BY_MAX_CAP[max_item_chars]
+    else:
+        nouns = NOUNS_BY_MAX[max_item_chars]
+        adjs = ADJECTIVES_BY_MAX[max_item_chars]
+    total_words = codenamize_space(adjectives, max_item_chars, hash_algo)
+
+    if POW2_SPACES:
+        mask = total_words - 1
+        indices = [ _hash_object(o, hash_algo) & mask for o in objs ]
+    else:
+        indices = [ _hash_object(o, hash_algo) % total_words for o in objs ]
+
+    bulk_arrays = _get_bulk_arrays()
+    if bulk_arrays is None:
+        return [ _decompose(index, adjectives, nouns, adjs) for index in indices ]
+
+    numpy, arrays = bulk_arrays
+    nouns_array, adjs_array = arrays[bool(capitalize)]
+
+    # Indices fit native integers for most spaces, otherwise keep Python ints
+    # (numpy.divmod does not support object arrays, so use // and % instead)
+    idxs = numpy.array(indices, dtype=numpy.int64 if total_words < 2 ** 63 else object)
+    rems = idxs % len(nouns)
+    idxs = idxs // len(nouns)
+    columns = [ numpy.take(nouns_array, rems.astype(numpy.intp)) ]
+    for _ in range(0, adjectives):
+        rems = idxs % len(adjs)
+        idxs = idxs // len(adjs)
+        columns.append(numpy.take(adjs_array, rems.astype(numpy.intp)))
+
+    columns.reverse()
+
+    return list(zip(*[ c.tolist() for c in columns ]))
 
 
 def codenamize_space(adjectives, max_item_chars, hash_algo = 'md5'):
@@ -324,6 +580,68 @@ def codenamize_space(adjectives, max_item_chars, hash_algo = 'md5'):
     return codenamize_particles(None, adjectives, max_item_chars, hash_algo)
 
 
+# Codename spaces up to this size are resolved by codenamize() through a
+# codename table (disabled by default, see set_codename_table_max_size())
+CODENAME_TABLE_MAX_SIZE = 0
+
+
+def set_codename_table_max_size(size):
+    """
+    Sets the maximum codename space size for which codenamize() uses a
+    precomputed codename table (default 0, which disables tables).
+
+    Codenames are the same either way. Building a table takes time and memory
+    proportional to the space size (see build_codename_table()), so this is
+    only worth enabling for long running processes that codenamize many
+    objects in a few small codename spaces.
+    """
+    global CODENAME_TABLE_MAX_SIZE
+    CODENAME_TABLE_MAX_SIZE = size
+
+
+@functools.lru_cache(maxsize=4)
+def build_codename_table(adjectives = 1, max_item_chars = 0):
+    """
+    Returns a tuple with the word indexes (adjectives first, noun last) of every
+    codename of the codename space for the given options, ordered by codename
+    space index. The same table serves any join and capitalize options.
+
+    This is intended for small codename spaces (see codenamize_space()), as
+    the table holds one tuple per codename (about 70 bytes each, so 7 MB for
+    a 100000 codename space). Up to 4 tables are cached, and they can be
+    released with build_codename_table.cache_clear().
+    """
+
+    max_item_chars = _clamp_max_item_chars(max_item_chars)
+    adjectives = max(adjectives, 0)
+
+    # Outer adjectives are the most significant digits of the index
+    particles = [ range(0, ADJECTIVES_LENGTHS[max_item_chars]) for _ in range(0, adjectives) ]
+    particles.append(range(0, NOUNS_LENGTHS[max_item_chars]))
+    return tuple(itertools.product(*particles))
+
+
+def codenamize_from_index(index, adjectives = 1, max_item_chars = 0, join = "-", capitalize = False):
+    """
+    Returns the codename for the given integer index (taken modulo the codename
+    space size), looked up from the codename table for the given options.
+    """
+
+    table = build_codename_table(adjectives, max_item_chars)
+    word_indexes = table[index % len(table)]
+
+    # Lists for each max_item_chars are prefixes of the full sorted lists
+    nouns = NOUNS_CAP if capitalize else NOUNS
+    adjs = ADJECTIVES_CAP if capitalize else ADJECTIVES
+    if join is None:
+        join = ""
+
+    codename_particles = [ adjs[i] for i in word_indexes[:-1] ]
+    codename_particles.append(nouns[word_indexes[-1]])
+    return join.join(codename_particles)
+
+
+@_memoize(maxsize=16384)
 def codenamize(obj, adjectives = 1, max_item_chars = 0, join = "-", capitalize = False, hash_algo = 'md5'):
     """
     Returns a consistent codename for the given object, by joining random
@@ -335,23 +653,51 @@ def codenamize(obj, adjectives = 1, max_item_chars = 0, join = "-", capitalize =
         max_item_chars (int): Max characters of each part of the codename (0 for no limit).
         join: (string) Stromg used to join codename parts (default "-").
         capitalize (boolean): Capitalize first letter of each word (default False).
+        hash_algo (string): Hash algorithm name (see codenamize_particles(), default 'md5').
 
     Changing max_item_length will produce different results for the same objects,
     so existing mapped codenames will change substantially.
-    """
 
-    codename_particles = codenamize_particles(obj, adjectives, max_item_chars, hash_algo)
+    Codename tables can be enabled for small codename spaces with
+    set_codename_table_max_size() (see build_codename_table()).
+
+    Codenames are memoized (unhashable objects, such as bytearray, are not
+    cached). The cache can be cleared with codenamize.cache_clear().
+    """
 
     if join is None:
         join = ""
-    if capitalize:
-        codename_particles = [ p[0].upper() + p[1:] for p in codename_particles]
+
+    if codenamize_space(adjectives, max_item_chars, hash_algo) <= CODENAME_TABLE_MAX_SIZE:
+        return codenamize_from_index(_hash_object(obj, hash_algo), adjectives, max_item_chars, join, capitalize)
+
+    codename_particles = codenamize_particles(obj, adjectives, max_item_chars, hash_algo, capitalize)
+
+    # Concatenate directly for the common 1 and 2 adjective cases
+    if adjectives == 1:
+        return codename_particles[0] + join + codename_particles[1]
+    if adjectives == 2:
+        return codename_particles[0] + join + codename_particles[1] + join + codename_particles[2]
 
     codename = join.join(codename_particles)
 
     return codename
 
 
+def codenamize_many(objs, adjectives = 1, max_item_chars = 0, join = "-", capitalize = False, hash_algo = 'md5'):
+    """
+    Returns a list with a consistent codename for each of the given objects.
+    Arguments are the same as for codenamize(), but this is faster when
+    codenamizing many objects at once (see codenamize_particles_bulk()).
+    """
+
+    if join is None:
+        join = ""
+
+    return [ join.join(codename_particles)
+             for codename_particles in codenamize_particles_bulk(objs, adjectives, max_item_chars, hash_algo, capitalize) ]
+
+
 def print_test():
     """
     Test and example function for the "codenamize" module.
@@ -367,35 +713,39 @@ def print_test():
             print("%d adj (max %d chars) = %d combinations" % (a, m, codenamize_space(a, m)))
 
     print("TESTS")
-    l1 = list(set( [ codenamize(a, 1, 3) for a in range(0, 2760 + 17) ] ))
-    l2 = list(set( [ codenamize(a, 2, 3) for a in range(0, 66240 + 17) ] ))
+    l1 = list(set(codenamize_many(range(0, 2760 + 17), 1, 3)))
+    l2 = list(set(codenamize_many(range(0, 66240 + 17), 2, 3)))
     print("  (*, 1 adj, max 3) => %d distinct results (space size is %d)" % (len(l1), codenamize_space(1, 3)))
     print("  (*, 2 adj, max 3) => %d distinct results (space size is %d)" % (len(l2), codenamize_space(2, 3)))
-    print("  (100001, 1 adj, max 5) => %s (must be 'funny-boat')" % (codenamize(100001, 1, 5)))
-    print("  ('100001', 1 adj, max 5) => %s (must be 'funny-boat')" % (codenamize('100001', 1, 5)))
-    print("  (u'100001', 1 adj, max 5) => %s (must be 'funny-boat')" % (codenamize(u'100001', 1, 5)))
+    print("  (100001, 1 adj, max 5) => %s (must be 'faint-perch')" % (codenamize(100001, 1, 5)))
+    print("  ('100001', 1 adj, max 5) => %s (must be 'faint-perch')" % (codenamize('100001', 1, 5)))
+    print("  (u'100001', 1 adj, max 5) => %s (must be 'faint-perch')" % (codenamize(u'100001', 1, 5)))
 
 
 def main():
 
+    # Imported here, as it is only needed by the command line tool
+    import argparse
+
     parser = argparse.ArgumentParser(description='Generate consistent easier-to-remember codenames from strings and numbers.')
     parser.add_argument('strings', nargs='*', help="One or more strings to codenamize.")
     parser.add_argument('-p', '--prefix', dest='prefix', action='store', type=int, default=1, help='number of prefixes to use')
     parser.add_argument('-m', '--maxchars', dest='maxchars', action='store', type=int, default=0, help='max word characters (0 for no limit)')
     parser.add_argument('-a', '--hash_algorithm', dest='hash_algo', action='store', type=str, default='md5',
-                        help='the algorithm to use to hash the input value (default: md5)')
+                        help='the algorithm to use to hash the input value, blake2b-16 is fastest, '
+                             'fastint mixes numeric input as integers (default: md5)')
     parser.add_argument('-j', '--join', dest='join', action='store', default="-", help='separator between words (default: -)')
     parser.add_argument('-c', '--capitalize', dest='capitalize', action='store_true', help='capitalize words')
     parser.add_argument('--space', dest='space', action='store_true', help='show codename space for the given arguments')
     parser.add_argument('--tests', dest='tests', action='store_true', help='show information and samples')
     parser.add_argument('--list_algorithms', dest='list_algorithms', action='store_true',
                         help='List the hash algorithms available')
-    parser.add_argument('--version', action='version', version='codenamize %s' % ("1.2.3"))
+    parser.add_argument('--version', action='version', version='codenamize %s' % ("1.3.0"))
 
     args = parser.parse_args()
 
     if args.list_algorithms:
-        for a in hashlib.algorithms_available:
+        for a in sorted(set(hashlib.algorithms_available) | set(HASH_ALGORITHMS_EXTRA) | {HASH_ALGORITHM_FASTINT}):
             print(a)
         return
 
@@ -412,6 +762,12 @@ def main():
         return
 
     for o in args.strings:
+        # Numeric arguments are codenamized as integers with fastint
+        if args.hash_algo == HASH_ALGORITHM_FASTINT:
+            try:
+                o = int(o)
+            except ValueError:
+                pass
         print(codenamize(o, args.prefix, args.maxchars, args.join, args.capitalize, args.hash_algo))
 
 
@@ -16,20 +16,24 @@ url = 'http://github.com/jjmontesl/codenamize'
 author = 'Jose Juan Montes'
 author_email = 'jjmontes@gmail.com'
 license = 'MIT'
-install_requires = ['six', 'wheel']
+install_requires = ['wheel']
+extras_require = {'numpy': ['numpy']}
 classifiers = [
     'Development Status :: 5 - Production/Stable',
     'Intended Audience :: Developers',
     'License :: OSI Approved :: MIT License',
     'Operating System :: POSIX',
     'Programming Language :: Python',
-    'Programming Language :: Python :: 2.6',
-    'Programming Language :: Python :: 2.7',
     'Programming Language :: Python :: 3',
-    'Programming Language :: Python :: 3.2',
-    'Programming Language :: Python :: 3.3',
-    'Programming Language :: Python :: 3.4',
+    'Programming Language :: Python :: 3 :: Only',
+    'Programming Language :: Python :: 3.7',
+    'Programming Language :: Python :: 3.8',
+    'Programming Language :: Python :: 3.9',
+    'Programming Language :: Python :: 3.10',
+    'Programming Language :: Python :: 3.11',
+    'Programming Language :: Python :: 3.12',
 ]
+python_requires = '>=3.7'
 
 
 def get_version(package):
@@ -84,6 +88,8 @@ setup(
     packages=get_packages(package),
     package_data=get_package_data(package),
     install_requires=install_requires,
+    python_requires=python_requires,
+    extras_require=extras_require,
     classifiers=classifiers,
     entry_points={'console_scripts': ['codenamize=codenamize.codenamize:main']},
 )
@@ -1,10 +1,11 @@
 from collections import defaultdict
-from codenamize import codenamize
+from codenamize import codenamize, codenamize_space
 import random
 
 counts = defaultdict(lambda: 0)
+space = codenamize_space(1, 3)
 
-for i in range(0, 2760 * 100):
+for i in range(0, space * 100):
     val = random.randint(0, 999999999999)
     res = codenamize(val, 1, 3, '', True)
     #print "%s %s" % (val, res)
@@ -12,5 +13,5 @@ for i in range(0, 2760 * 100):
 
 for k, v in counts.items():
     print("%s %s" % (k, v))
-print("Length: %d (expected 2760)" % (len(counts)))
+print("Length: %d (expected %d)" % (len(counts), space))
 
@@ -0,0 +1,138 @@
+import doctest
+import importlib
+import os
+import subprocess
+import sys
+import unittest
+
+import codenamize
+
+cn = importlib.import_module('codenamize.codenamize')
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+OBJECTS = list(range(-20, 1500)) + [10 ** 30, "11:22:33:44:55:66", u"héllo", b"bytes", True]
+
+OPTIONS = [ (a, m, join, capitalize)
+            for a in (0, 1, 2, 4, 8)
+            for m in (0, 3, 5)
+            for join, capitalize in (("-", False), ("", True), (None, False)) ]
+
+
+def scalar_codenames(objs, adjectives, max_item_chars, join, capitalize, hash_algo = 'md5'):
+    codenamize.codenamize.cache_clear()
+    return [ codenamize.codenamize(o, adjectives, max_item_chars, join, capitalize, hash_algo) for o in objs ]
+
+
+class CodenamesTestCase(unittest.TestCase):
+
+    def test_docstring_examples(self):
+        self.assertEqual(doctest.testmod(cn).failed, 0)
+
+    def test_known_codenames(self):
+        self.assertEqual(codenamize.codenamize(100001, 1, 5), 'faint-perch')
+        self.assertEqual(codenamize.codenamize(100001, 2, 0, "", True), 'GroundingEtchedMoon')
+        self.assertEqual(codenamize.codenamize_space(2, 0), 108945963)
+
+
+class BulkTestCase(unittest.TestCase):
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_bulk_numpy_matches_scalar(self):
+        for options in OPTIONS:
+            self.assertEqual(codenamize.codenamize_many(OBJECTS, *options), scalar_codenames(OBJECTS, *options), options)
+
+    def test_bulk_without_numpy_matches_scalar(self):
+        bulk_arrays = cn._BULK_ARRAYS
+        cn._BULK_ARRAYS = False
+        try:
+            for options in OPTIONS:
+                self.assertEqual(codenamize.codenamize_many(OBJECTS, *options), scalar_codenames(OBJECTS, *options), options)
+        finally:
+            cn._BULK_ARRAYS = bulk_arrays
+
+    def test_bulk_empty(self):
+        self.assertEqual(codenamize.codenamize_many([]), [])
+
+
+class TableTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        codenamize.set_codename_table_max_size(0)
+        codenamize.codenamize.cache_clear()
+
+    def test_table_matches_scalar(self):
+        for a, m in ((0, 0), (1, 3), (1, 5), (2, 3), (2, 4), (4, 3)):
+            for join, capitalize in (("-", False), ("", True), (None, False)):
+                expected = scalar_codenames(OBJECTS, a, m, join, capitalize)
+                codenamize.set_codename_table_max_size(10 ** 6)
+                self.assertEqual(scalar_codenames(OBJECTS, a, m, join, capitalize), expected, (a, m, join, capitalize))
+                codenamize.set_codename_table_max_size(0)
+
+    def test_table_size(self):
+        for a, m in ((0, 0), (1, 3), (2, 3)):
+            self.assertEqual(len(codenamize.build_codename_table(a, m)), codenamize.codenamize_space(a, m))
+
+
+class HashTestCase(unittest.TestCase):
+
+    def test_unhashable_objects(self):
+        self.assertEqual(codenamize.codenamize(bytearray(b"abc")), codenamize.codenamize(b"abc"))
+        self.assertEqual(codenamize.codenamize(memoryview(b"abc"), 2), codenamize.codenamize(b"abc", 2))
+
+    def test_int_and_string_codenames_match(self):
+        self.assertEqual(codenamize.codenamize(100001, 1, 5), codenamize.codenamize("100001", 1, 5))
+        self.assertEqual(codenamize.codenamize(100001, 1, 5), codenamize.codenamize(b"100001", 1, 5))
+
+    def test_fastint_zero_is_mixed(self):
+        for a, m in ((0, 0), (1, 0), (2, 3)):
+            first_words = "-".join([ cn.ADJECTIVES[0] ] * a + [ cn.NOUNS[0] ])
+            self.assertNotEqual(codenamize.codenamize(0, a, m, hash_algo='fastint'), first_words)
+
+    def test_fastint_negative_numbers(self):
+        for v in (1, 2, 12345, 2 ** 70):
+            self.assertNotEqual(codenamize.codenamize(-v, 2, hash_algo='fastint'), codenamize.codenamize(v, 2, hash_algo='fastint'))
+
+    def test_fastint_bools_use_md5(self):
+        self.assertEqual(codenamize.codenamize(True, 2, hash_algo='fastint'), codenamize.codenamize(True, 2))
+        self.assertNotEqual(codenamize.codenamize(True, 2, hash_algo='fastint'), codenamize.codenamize(1, 2, hash_algo='fastint'))
+
+    def test_fastint_strings_use_md5(self):
+        self.assertEqual(codenamize.codenamize("abc", 2, hash_algo='fastint'), codenamize.codenamize("abc", 2))
+
+
+POW2_SCRIPT = """
+import codenamize
+objs = list(range(0, 1500)) + ["x", b"y"]
+for a in (0, 1, 2, 4):
+    for m in (0, 3, 5):
+        space = codenamize.codenamize_space(a, m)
+        assert space & (space - 1) == 0, (a, m, space)
+        for join, capitalize in (("-", False), ("", True)):
+            expected = [ codenamize.codenamize(o, a, m, join, capitalize) for o in objs ]
+            assert codenamize.codenamize_many(objs, a, m, join, capitalize) == expected, (a, m)
+            codenamize.set_codename_table_max_size(10 ** 6)
+            codenamize.codenamize.cache_clear()
+            assert [ codenamize.codenamize(o, a, m, join, capitalize) for o in objs ] == expected, (a, m)
+            codenamize.set_codename_table_max_size(0)
+            codenamize.codenamize.cache_clear()
+print("ok")
+"""
+
+
+class Pow2SpacesTestCase(unittest.TestCase):
+
+    def test_pow2_spaces(self):
+        env = dict(os.environ, CODENAMIZE_POW2_SPACES='1')
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env['PYTHONPATH'] = root + os.pathsep + env.get('PYTHONPATH', '')
+        output = subprocess.check_output([ sys.executable, '-c', POW2_SCRIPT ], env=env)
+        self.assertEqual(output.strip(), b"ok")
+
+
+if __name__ == '__main__':
+    unittest.main()